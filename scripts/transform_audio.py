@@ -1,4 +1,3 @@
-
 """
 Module for processing and transforming audio files.
 
@@ -6,20 +5,99 @@ This module provides functionality to load audio files, resample them to a targe
 sample rate, convert them to mono, and save the processed results.
 """
 
+import argparse
+import os
 from pathlib import Path
 
-import librosa
+import numpy as np
 import soundfile as sf
-from tqdm import tqdm
+import soxr
+from tqdm.contrib.concurrent import process_map
+
+BLOCK_SIZE = 65536
+
+
+def _write_pcm16_block(sink: sf.SoundFile, y: np.ndarray) -> None:
+    """
+    Clamp a block of samples to full scale and append it to a 16-bit output file.
+
+    Parameters
+    ----------
+    sink: sf.SoundFile
+        The output file opened for writing.
+    y: np.ndarray
+        The mono float samples to write. Clamped in place so the 16-bit conversion cannot
+        wrap around.
+    """
+    np.clip(y, -1.0, 1.0, out=y)
+    sink.write(y)
+
 
+def _process_one(audio_file: Path, output_path: Path, sample_rate: int) -> tuple[Path, str | None]:
+    """
+    Resample a single audio file to mono and write it to the output directory.
+
+    Parameters
+    ----------
+    audio_file: Path
+        Path to the input WAV file.
+    output_path: Path
+        Path to the directory where the processed audio file will be saved.
+    sample_rate: int
+        Target sample rate in Hz.
 
-def process_audio_files(input_path: Path, output_path: Path, sample_rate: int = 24000) -> None:
+    Returns
+    -------
+    : tuple[Path, str | None]
+        The input path and an error message, or None if the file was processed successfully.
+    """
+    output_file = output_path.joinpath(f"{audio_file.stem}.wav")
+    # Write under a temporary name so a failed conversion never leaves a truncated clip
+    # that `list_audio_files` would later pick up as a foreground event. Inputs are found
+    # recursively and may share a stem, so the name includes the worker's PID to keep
+    # concurrent workers from writing the same file.
+    tmp_file = output_path.joinpath(f".{audio_file.stem}.{os.getpid()}.wav.part")
+    try:
+        with sf.SoundFile(audio_file) as source:
+            # Resample only if required, streaming so memory stays bounded by the block size
+            resampler = (
+                soxr.ResampleStream(source.samplerate, sample_rate, 1, dtype="float32")
+                if source.samplerate != sample_rate
+                else None
+            )
+            with sf.SoundFile(
+                tmp_file, "w", sample_rate, 1, subtype="PCM_16", format="WAV"
+            ) as sink:
+                for block in source.blocks(blocksize=BLOCK_SIZE, dtype="float32", always_2d=True):
+                    # Downmix to mono
+                    y = block.mean(axis=1)
+                    if resampler is not None:
+                        y = resampler.resample_chunk(y)
+                    _write_pcm16_block(sink, y)
+                if resampler is not None:
+                    _write_pcm16_block(
+                        sink, resampler.resample_chunk(np.zeros(0, dtype=np.float32), last=True)
+                    )
+        os.replace(tmp_file, output_file)
+    except Exception as e:
+        tmp_file.unlink(missing_ok=True)
+        return audio_file, str(e)
+    return audio_file, None
+
+
+def process_audio_files(
+    input_path: Path,
+    output_path: Path,
+    sample_rate: int = 24000,
+    max_workers: int | None = None,
+    chunksize: int = 8,
+) -> None:
     """
     Process audio files by resampling and converting to mono.
 
     Loads all WAV files from the input directory, resamples them to the specified
     sample rate, converts them to mono, and saves the processed files to the output
-    directory.
+    directory. Files are processed in parallel across a pool of worker processes.
 
     Parameters
     ----------
@@ -29,39 +107,75 @@ def process_audio_files(input_path: Path, output_path: Path, sample_rate: int =
         Path to the directory where processed audio files will be saved.
     sample_rate: int, optional
         Target sample rate in Hz. Defaults to 24000.
+    max_workers: int | None, optional
+        Number of worker processes. Defaults to None, which uses all available CPU cores.
+    chunksize: int, optional
+        Number of files handed to a worker at a time. Defaults to 8.
 
     Returns
     -------
         None
 
-    Raises
-    ------
-    Exception
-        Prints error message if any audio file fails to process, but continues
-                   processing remaining files.
+    Notes
+    -----
+    Failures do not raise. Each worker returns the error of a file it could not process,
+    the remaining files are still processed, and all errors are printed once the pool has
+    finished.
     """
     output_path.mkdir(parents=True, exist_ok=True)
 
     # Get all .wav files in the input directory
     audio_files = list(input_path.rglob("*.wav"))
+    n_files = len(audio_files)
+
+    print(f"Found {n_files} audio files to process.")
+
+    results = process_map(
+        _process_one,
+        audio_files,
+        [output_path] * n_files,
+        [sample_rate] * n_files,
+        max_workers=max_workers or os.cpu_count(),
+        chunksize=chunksize,
+        desc="Processing audio files",
+    )
+
+    for audio_file, error in results:
+        if error is not None:
+            print(f"Error processing {audio_file}: {error}")
+
+
+def _parse_args() -> argparse.Namespace:
+    """Parse command-line arguments for audio processing."""
+    parser = argparse.ArgumentParser(
+        description="Resample audio files to mono at a target sample rate."
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Number of worker processes. Defaults to the number of CPU cores.",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=8,
+        help="Number of files handed to a worker at a time.",
+    )
+    return parser.parse_args()
 
-    print(f"Found {len(audio_files)} audio files to process.")
-
-    for audio_file in tqdm(audio_files, desc="Processing audio files"):
-        try:
-            # Load the audio file, resample to the target sample rate, and convert to mono
-            y, sr = librosa.load(audio_file, sr=sample_rate, mono=True)
-
-            # Save the processed audio file
-            output_file = output_path.joinpath(f"{audio_file.stem}.wav")
-            sf.write(output_file, y, sr)
-        except Exception as e:
-            print(f"Error processing {audio_file}: {e}")
 
 if __name__ == "__main__":
+    args = _parse_args()
     input_dir = Path("data/esc50/audio")
     output_dir = Path("data/esc50/fg_esc50_24k_mono")
 
-    process_audio_files(input_dir, output_dir, sample_rate=24000)
+    process_audio_files(
+        input_dir,
+        output_dir,
+        sample_rate=24000,
+        max_workers=args.max_workers,
+        chunksize=args.chunksize,
+    )
 
     print("Audio processing complete.")
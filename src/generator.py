@@ -6,8 +6,12 @@ and acoustic scenes with multiple sound events for dataset creation.
 """
 
 import argparse
+import multiprocessing as mp
+import os
 import shutil
+import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import audiblelight
@@ -22,17 +26,252 @@ from audiblelight.augmentation import (
     LowpassFilter,
     LowShelfFilter,
 )
+from audiblelight.class_mappings import ClassMapping
 from tqdm import tqdm
 
 import utils
 
+EVENT_AUGMENTATIONS = [
+    Compressor,
+    Fade,
+    Gain,
+    HighpassFilter,
+    HighShelfFilter,
+    LowpassFilter,
+    LowShelfFilter,
+]
+MOVE_THREADS = 4
+_ALWAYS_CLASS0 = (0, "dummy")
+
+
+class AlwaysClass0Mapping(ClassMapping):  # type: ignore[no-any-unimported]
+    """A ClassMapping that always returns class index 0 with a dummy label."""
+
+    def __init__(self) -> None:
+        super().__init__(mapping={"dummy": 0})
+
+    def infer_label_idx_from_filepath(self, filepath: Path | str) -> tuple[int, str]:
+        """Return class index 0 and label 'dummy'."""
+        return _ALWAYS_CLASS0
+
+
+# Per-worker state, populated once per process by `_init_worker`.
+_worker_cfg: utils.GeneratorConfig  # type: ignore[no-any-unimported]
+_worker_fg_files: list[Path]
+_worker_tmpdir: Path
+_worker_move_executor: ThreadPoolExecutor
+
+
+def _init_worker(  # type: ignore[no-any-unimported]
+    cfg: utils.GeneratorConfig, fg_files: list[Path], scratch_dir: Path
+) -> None:
+    """
+    Cache state shared by all scenes rendered in a worker process.
+
+    Parameters
+    ----------
+    cfg: utils.GeneratorConfig
+        The loaded generator configuration.
+    fg_files: list[Path]
+        The available foreground audio files.
+    scratch_dir: Path
+        The run's scratch directory inside the audio output, removed by `main`.
+    """
+    global _worker_cfg, _worker_fg_files, _worker_tmpdir, _worker_move_executor  # noqa: PLW0603
+    _worker_cfg = cfg
+    _worker_fg_files = fg_files
+    # One temporary directory per worker inside the audio output, so audio moves are renames.
+    _worker_tmpdir = Path(tempfile.mkdtemp(dir=scratch_dir))
+    # Move threads are started once per worker rather than once per scene.
+    _worker_move_executor = ThreadPoolExecutor(max_workers=MOVE_THREADS)
+    # Set the global seed for any random operations within AudibleLight to ensure reproducibility.
+    audiblelight_utils.SEED = cfg.runtime.seed
+    utils.enable_mesh_cache()
+
+
+def _render_scene(
+    scene_idx: int, seed: np.random.SeedSequence, bg_noise: str, mesh_path: Path
+) -> None:
+    """
+    Render a single scene and move its outputs to the final output location.
+
+    Parameters
+    ----------
+    scene_idx: int
+        The index of the scene, used to name the output files.
+    seed: np.random.SeedSequence
+        The seed sequence for this scene, making it reproducible independent of the worker.
+    bg_noise: str
+        The background noise type for this scene.
+    mesh_path: Path
+        The mesh the scene is rendered in.
+    """
+    cfg = _worker_cfg
+    fg_files = _worker_fg_files
+    audio_out = cfg.paths.audio_out
+    meta_out = cfg.paths.meta_out
+
+    rng = np.random.default_rng(seed)
+    # AudibleLight samples backend placements from the global NumPy state, so reseed it per scene.
+    np.random.seed(seed.generate_state(1)[0])
+
+    stem = f"scene_{scene_idx:05d}"
+
+    backend_kwargs = utils.build_backend_kwargs_rlr(str(mesh_path))
+
+    scene = audiblelight.Scene(
+        duration=cfg.scene.scene_duration,
+        sample_rate=cfg.scene.sample_rate,
+        backend="rlr",
+        backend_kwargs=backend_kwargs,
+        fg_path=cfg.paths.fg_dir,
+        max_overlap=cfg.scene.max_overlap,
+        class_mapping=AlwaysClass0Mapping(),
+        event_augmentations=EVENT_AUGMENTATIONS,
+        ref_db=cfg.scene.bg_noise_floor_db,
+    )
+
+    # Add microphones at random positions within the mesh bounds for this scene
+    for _ in range(cfg.runtime.num_mics_per_scene):
+        utils.add_random_microphone(
+            scene,
+            mic_type=cfg.scene.mic_type,
+        )
+
+    plan = utils.make_event_plan(rng, fg_files, cfg.scene.scene_duration, cfg.events)
+    for wav, start, duration, snr in zip(
+        plan.wavs, plan.starts.tolist(), plan.durations.tolist(), plan.snrs.tolist(), strict=True
+    ):
+        utils.add_random_fg_event(
+            scene=scene,
+            wav=wav,
+            event_start=start,
+            event_duration=duration,
+            signal_to_noise_ratio=snr,
+        )
+
+    scene.add_ambience(noise=bg_noise)
+
+    # Render to the worker's temporary directory and then move to the final output location
+    # in the DCASE-like format.
+    tmpdir = _worker_tmpdir
+    try:
+        scene.generate(
+            output_dir=tmpdir,
+            audio=True,
+            metadata_json=False,
+            metadata_dcase=True,
+            audio_fname=stem,
+            metadata_fname=stem,
+        )
+
+        # Collect the rendered files in a single directory pass.
+        wavs: dict[str, str] = {}
+        csvs: dict[str, str] = {}
+        with os.scandir(tmpdir) as entries:
+            for entry in entries:
+                entry_stem, ext = os.path.splitext(entry.name)
+                if ext == ".wav":
+                    wavs[entry_stem] = entry.path
+                elif ext == ".csv":
+                    csvs[entry_stem] = entry.path
+        common = wavs.keys() & csvs.keys()
+        if len(common) != cfg.runtime.num_mics_per_scene:
+            raise RuntimeError(
+                f"Expected {cfg.runtime.num_mics_per_scene} wav/csv pairs, got {len(common)}. "
+                f"WAVs={len(wavs)}, CSVs={len(csvs)} in '{tmpdir}'."
+            )
+
+        # AudibleLight names outputs "<stem>_<mic alias>", so number them in the order the
+        # microphones were added instead of sorting the stems.
+        sources: list[str] = []
+        destinations: list[Path] = []
+        for i, mic_alias in enumerate(scene.state.microphones):
+            in_stem = f"{stem}_{mic_alias}"
+            out_stem = f"{stem}_mic{i:02d}"
+            sources += [wavs[in_stem], csvs[in_stem]]
+            destinations += [
+                audio_out.joinpath(f"{out_stem}.wav"),
+                meta_out.joinpath(f"{out_stem}.csv"),
+            ]
+
+        # Moving is pure I/O, so overlap it on the worker's move threads.
+        list(_worker_move_executor.map(utils.move_file, sources, destinations))
+    finally:
+        # Drain leftovers so the next scene in this worker starts from an empty directory.
+        with os.scandir(tmpdir) as entries:
+            for entry in entries:
+                os.unlink(entry.path)
+
+
+def _render_scenes(mesh_path: Path, scenes: list[tuple[int, np.random.SeedSequence, str]]) -> int:
+    """
+    Render a batch of scenes sharing a mesh back to back, so they reuse the cached mesh.
+
+    Parameters
+    ----------
+    mesh_path: Path
+        The mesh all scenes of the batch are rendered in.
+    scenes: list[tuple[int, np.random.SeedSequence, str]]
+        The index, seed sequence and background noise type of every scene in the batch.
+
+    Returns
+    -------
+    : int
+        The number of scenes rendered.
+    """
+    for scene_idx, seed, bg_noise in scenes:
+        _render_scene(scene_idx, seed, bg_noise, mesh_path)
+    return len(scenes)
+
+
+def _batch_scenes_by_mesh(mesh_indices: np.ndarray, batch_size: int) -> list[tuple[int, list[int]]]:
+    """
+    Group scene indices by the mesh they use, in batches of at most `batch_size` scenes.
+
+    Parameters
+    ----------
+    mesh_indices: np.ndarray
+        The mesh index of every scene.
+    batch_size: int
+        The maximum number of scenes per batch, so a frequent mesh is still spread across
+        several workers.
+
+    Returns
+    -------
+    : list[tuple[int, list[int]]]
+        The mesh index and the scene indices of every batch.
+    """
+    scenes_by_mesh: dict[int, list[int]] = {}
+    for scene_idx, mesh_idx in enumerate(mesh_indices.tolist()):
+        scenes_by_mesh.setdefault(mesh_idx, []).append(scene_idx)
+    return [
+        (mesh_idx, scene_idxs[start : start + batch_size])
+        for mesh_idx, scene_idxs in scenes_by_mesh.items()
+        for start in range(0, len(scene_idxs), batch_size)
+    ]
+
+
+def _available_cpus() -> int:
+    """
+    Count the CPUs this process may run on.
+
+    Unlike `os.cpu_count`, this honours CPU affinity and cpuset limits, such as a container
+    started with `--cpuset-cpus`.
+
+    Returns
+    -------
+    : int
+        The number of usable CPUs, at least 1.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
 
 def main(config_path: Path | str = Path("config/config.yaml")) -> None:
     """Generate a dataset with AudibleLight."""
     cfg = utils.load_config(config_path)
-    rng = np.random.default_rng(seed=cfg.runtime.seed)
-    # Set the global seed for any random operations within AudibleLight to ensure reproducibility.
-    audiblelight_utils.SEED = cfg.runtime.seed
 
     fg_files = utils.list_audio_files(cfg.paths.fg_dir)
     if not fg_files:
@@ -50,81 +289,51 @@ def main(config_path: Path | str = Path("config/config.yaml")) -> None:
 
     meshes = utils.ensure_meshes(cfg.mesh.mesh_dir, cfg.mesh.download_gibson_flag)
 
-    event_augs = [
-        Compressor,
-        Fade,
-        Gain,
-        HighpassFilter,
-        HighShelfFilter,
-        LowpassFilter,
-        LowShelfFilter,
-    ]
-
-    for scene_idx in tqdm(range(n_scenes), desc="Generating scenes"):
-        stem = f"scene_{scene_idx:05d}"
-
-        mesh_path = meshes[int(rng.integers(0, len(meshes)))]
-        backend_kwargs = utils.build_backend_kwargs_rlr(mesh_path)
-
-        scene = audiblelight.Scene(
-            duration=cfg.scene.scene_duration,
-            sample_rate=cfg.scene.sample_rate,
-            backend="rlr",
-            backend_kwargs=backend_kwargs,
-            fg_path=cfg.paths.fg_dir,
-            max_overlap=cfg.scene.max_overlap,
-            class_mapping=utils.AlwaysClass0Mapping(),
-            event_augmentations=event_augs,
-            ref_db=cfg.scene.bg_noise_floor_db,
-        )
-
-        # Add microphones at random positions within the mesh bounds for this scene
-        for _ in range(cfg.runtime.num_mics_per_scene):
-            utils.add_random_microphone(
-                scene,
-                mic_type=cfg.scene.mic_type,
-            )
-
-        for _ in range(cfg.events.events_per_scene):
-            utils.add_random_fg_event(
-                fg_files=fg_files,
-                scene=scene,
-                scene_duration=cfg.scene.scene_duration,
-                event_duration_min=cfg.events.event_duration_min,
-                event_duration_max=cfg.events.event_duration_max,
-                snr_min=cfg.events.snr_min,
-                snr_max=cfg.events.snr_max,
-                rng=rng,
-            )
-
-        scene.add_ambience(noise=utils.get_random_bg_noise(rng))
-
-        # Render to a temporary directory and then move to the final output location
-        # in the DCASE-like format.
-        with tempfile.TemporaryDirectory(prefix="audiblelight_") as tmpdir:
-            tmpdir_path = Path(tmpdir)
-            scene.generate(
-                output_dir=tmpdir_path,
-                audio=True,
-                metadata_json=False,
-                metadata_dcase=True,
-                audio_fname=stem,
-                metadata_fname=stem,
-            )
+    # Every scene gets its own child seed, so results do not depend on the worker count.
+    root_seed = np.random.SeedSequence(cfg.runtime.seed)
+    scene_seeds = root_seed.spawn(n_scenes)
+    run_rng = np.random.default_rng(root_seed)
+    bg_noises = utils.get_random_bg_noises(run_rng, n_scenes)
+    # Meshes are drawn here rather than per scene, so scenes sharing a mesh can be rendered
+    # back to back in one worker and reuse its cached mesh.
+    mesh_indices = run_rng.integers(0, len(meshes), size=n_scenes)
+    max_workers = min(cfg.runtime.num_workers or _available_cpus(), n_scenes)
+    batches = _batch_scenes_by_mesh(mesh_indices, -(-n_scenes // max_workers))
 
-            wavs = {p.stem: p for p in tmpdir_path.glob("*.wav")}
-            csvs = {p.stem: p for p in tmpdir_path.glob("*.csv")}
-            common = sorted(set(wavs) & set(csvs))
-            if len(common) != cfg.runtime.num_mics_per_scene:
-                raise RuntimeError(
-                    f"Expected {cfg.runtime.num_mics_per_scene} wav/csv pairs, got {len(common)}. "
-                    f"WAVs={len(wavs)}, CSVs={len(csvs)} in '{tmpdir_path}'."
+    # Hidden scratch directory for the workers' renders. It is owned by this process, so it is
+    # removed even when a worker is killed before it can clean up after itself.
+    scratch_dir = Path(tempfile.mkdtemp(prefix=".audiblelight_", dir=audio_out))
+    try:
+        # Use "spawn" so workers do not inherit fork-unsafe state from the ray-tracing backend.
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(cfg, fg_files, scratch_dir),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _render_scenes,
+                    meshes[mesh_idx],
+                    [(i, scene_seeds[i], bg_noises[i]) for i in scene_idxs],
                 )
-
-            for i, in_stem in enumerate(common):
-                out_stem = f"{stem}_mic{i:02d}"
-                shutil.move(str(wavs[in_stem]), str(audio_out.joinpath(f"{out_stem}.wav")))
-                shutil.move(str(csvs[in_stem]), str(meta_out.joinpath(f"{out_stem}.csv")))
+                for mesh_idx, scene_idxs in batches
+            ]
+            try:
+                with tqdm(
+                    total=n_scenes,
+                    desc="Generating scenes",
+                    mininterval=1.0,
+                    smoothing=0,
+                    disable=not sys.stderr.isatty(),
+                ) as progress:
+                    for future in as_completed(futures):
+                        progress.update(future.result())
+            except BaseException:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
 
     print(f"Wrote {n_scenes} scenes")
     print(f"Audio:    {audio_out}")
@@ -1,22 +1,45 @@
 """Utility functions for the AudibleLight dataset generator."""
 
+import errno
+import functools
+import os
+import shutil
 import warnings
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Union
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-import audiblelight
 import numpy as np
 import yaml
-from audiblelight.class_mappings import ClassMapping
-from audiblelight.download_data import download_gibson
+
+# AudibleLight pulls in trimesh, torch and friends, so it is only imported where it is used.
+if TYPE_CHECKING:
+    import audiblelight
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
 
 DEFAULT_FG_DIR = Path("data/esc50/fg_esc50_24k_mono")
 DEFAULT_MESH_DIR = Path("data/gibson")
+CONFIG_CACHE_SIZE = 64
+# Parsed meshes kept per worker process; each one holds its ray-tracing structures too.
+# Scenes are submitted grouped by mesh, so the current mesh is all that is reused.
+MESH_CACHE_SIZE = 1
+_BG_NOISES = ("white", "pink", "gaussian")
+# Placeholder for default output paths, which are timestamped when the config is loaded.
+_TIMESTAMPED_OUTPUT: Any = object()
 
+# Parsed config documents keyed by (path, mtime_ns, size), least recently used first.
+_config_cache: OrderedDict[tuple[str, int, int], Any] = OrderedDict()
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class PathsConfig:
     """Path configuration for data input/output."""
 
@@ -24,22 +47,23 @@ class PathsConfig:
     audio_out: Path
     meta_out: Path
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuntimeConfig:
     """Runtime controls for scene generation."""
 
     seed: int
     num_scenes: int
     num_mics_per_scene: int
+    num_workers: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MeshConfig:
     """Mesh discovery."""
 
     mesh_dir: Path
     download_gibson_flag: bool
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SceneConfig:
     """Scene-wide simulation configuration."""
 
@@ -49,7 +73,7 @@ class SceneConfig:
     mic_type: str
     bg_noise_floor_db: float
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventsConfig:
     """Foreground event generation configuration."""
 
@@ -59,7 +83,7 @@ class EventsConfig:
     snr_min: float
     snr_max: float
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GeneratorConfig:
     """Top-level configuration consumed by dataset generation."""
 
@@ -69,15 +93,14 @@ class GeneratorConfig:
     scene: SceneConfig
     events: EventsConfig
 
-class AlwaysClass0Mapping(ClassMapping):  # type: ignore[no-any-unimported]
-    """A ClassMapping that always returns class index 0 with a dummy label."""
-
-    def __init__(self) -> None:
-        super().__init__(mapping={"dummy": 0})
+@dataclass(frozen=True, slots=True)
+class EventPlan:
+    """Foreground events of a scene, one array entry per event."""
 
-    def infer_label_idx_from_filepath(self, filepath: Union[Path, str]) -> tuple[int, str]:
-        """Return class index 0 and label 'dummy'."""
-        return (0, "dummy")
+    wavs: list[Path]
+    starts: np.ndarray
+    durations: np.ndarray
+    snrs: np.ndarray
 
 def _build_default_output_paths() -> tuple[Path, Path]:
     """
@@ -95,46 +118,46 @@ def _build_default_output_paths() -> tuple[Path, Path]:
     meta_out = output_root.joinpath("metadata_dev", "dev-train")
     return audio_out, meta_out
 
-def _default_config_dict() -> dict[str, dict[str, Any]]:
-    """
-    Return default config values equivalent to prior argparse defaults.
-
-    Returns
-    -------
-    : dict[str, dict[str, Any]]
-        A nested dictionary containing default configuration values for all config sections.
-    """
-    default_audio_out, default_meta_out = _build_default_output_paths()
-    return {
-        "paths": {
-            "fg_dir": DEFAULT_FG_DIR,
-            "audio_out": default_audio_out,
-            "meta_out": default_meta_out,
-        },
-        "runtime": {
-            "seed": 0,
-            "num_scenes": 100,
-            "num_mics_per_scene": 5,
-        },
-        "mesh": {
-            "mesh_dir": DEFAULT_MESH_DIR,
-            "download_gibson_flag": True,
-        },
-        "scene": {
-            "sample_rate": 24000,
-            "scene_duration": 60.0,
-            "max_overlap": 15,
-            "mic_type": "eigenmike32",
-            "bg_noise_floor_db": -50.0,
-        },
-        "events": {
-            "events_per_scene": 15,
-            "event_duration_min": 0.5,
-            "event_duration_max": 10.0,
-            "snr_min": 0.0,
-            "snr_max": 30.0,
-        },
+# Default config values equivalent to prior argparse defaults, built once at import time.
+# The timestamped output paths are left as `_TIMESTAMPED_OUTPUT` placeholders and only built
+# by `load_config` when the YAML does not override them.
+_STATIC_DEFAULTS: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        section: MappingProxyType(values)
+        for section, values in {
+            "paths": {
+                "fg_dir": DEFAULT_FG_DIR,
+                "audio_out": _TIMESTAMPED_OUTPUT,
+                "meta_out": _TIMESTAMPED_OUTPUT,
+            },
+            "runtime": {
+                "seed": 0,
+                "num_scenes": 100,
+                "num_mics_per_scene": 5,
+                "num_workers": 0,
+            },
+            "mesh": {
+                "mesh_dir": DEFAULT_MESH_DIR,
+                "download_gibson_flag": True,
+            },
+            "scene": {
+                "sample_rate": 24000,
+                "scene_duration": 60.0,
+                "max_overlap": 15,
+                "mic_type": "eigenmike32",
+                "bg_noise_floor_db": -50.0,
+            },
+            "events": {
+                "events_per_scene": 15,
+                "event_duration_min": 0.5,
+                "event_duration_max": 10.0,
+                "snr_min": 0.0,
+                "snr_max": 30.0,
+            },
+        }.items()
     }
+)
+
 
 def _normalise_mapping(value: Any, key_name: str) -> dict[str, Any]:
     """
@@ -150,7 +173,8 @@ def _normalise_mapping(value: Any, key_name: str) -> dict[str, Any]:
     Returns
     -------
     : dict[str, Any]
-        The normalised mapping with string keys.
+        The validated mapping itself, not a copy. Callers must not mutate it, since parsed
+        config documents are cached between loads.
 
     """
     if value is None:
@@ -158,17 +182,15 @@ def _normalise_mapping(value: Any, key_name: str) -> dict[str, Any]:
     if not isinstance(value, dict):
         raise ValueError(f"Config key '{key_name}' must be a mapping.")
 
-    normalized: dict[str, Any] = {}
-    for key, mapping_value in value.items():
+    for key in value:
         if not isinstance(key, str):
             raise ValueError(f"Config key '{key_name}' contains a non-string key: {key!r}.")
-        normalized[key] = mapping_value
-    return normalized
+    return value
 
 
 def _warn_unknown_keys(
     config_values: dict[str, Any],
-    allowed_values: dict[str, Any],
+    allowed_keys: frozenset[str],
     section_name: str | None = None,
 ) -> None:
     """
@@ -178,7 +200,7 @@ def _warn_unknown_keys(
     ----------
     config_values: dict[str, Any]
         The config values to check for unknown keys.
-    allowed_values: dict[str, Any]
+    allowed_keys: frozenset[str]
         The allowed config keys to check against.
     section_name: str | None, optional
         The name of the config section being checked, used for more specific warning messages.
@@ -188,7 +210,8 @@ def _warn_unknown_keys(
     -------
     : None
     """
-    unknown_keys = sorted(set(config_values).difference(set(allowed_values)))
+    unknown_keys = [key for key in config_values if key not in allowed_keys]
+    unknown_keys.sort()
     for key in unknown_keys:
         if section_name is None:
             warnings.warn(f"Unknown config section '{key}' will be ignored.", stacklevel=2)
@@ -310,6 +333,106 @@ def _coerce_path(value: Any, key_name: str) -> Path:
     return path
 
 
+# Coercer for every config key per section, applied to the keys set in the YAML.
+_SCHEMA: dict[str, dict[str, Callable[[Any, str], Any]]] = {
+    "paths": {
+        "fg_dir": _coerce_path,
+        "audio_out": _coerce_path,
+        "meta_out": _coerce_path,
+    },
+    "runtime": {
+        "seed": _coerce_int,
+        "num_scenes": _coerce_int,
+        "num_mics_per_scene": _coerce_int,
+        "num_workers": _coerce_int,
+    },
+    "mesh": {
+        "mesh_dir": _coerce_path,
+        "download_gibson_flag": _coerce_bool,
+    },
+    "scene": {
+        "sample_rate": _coerce_int,
+        "scene_duration": _coerce_float,
+        "max_overlap": _coerce_int,
+        "mic_type": _coerce_str,
+        "bg_noise_floor_db": _coerce_float,
+    },
+    "events": {
+        "events_per_scene": _coerce_int,
+        "event_duration_min": _coerce_float,
+        "event_duration_max": _coerce_float,
+        "snr_min": _coerce_float,
+        "snr_max": _coerce_float,
+    },
+}
+
+# Allowed config keys, checked against the YAML on every load.
+_ALLOWED_ROOT = frozenset(_STATIC_DEFAULTS)
+_ALLOWED_SECTIONS = {section: frozenset(values) for section, values in _STATIC_DEFAULTS.items()}
+
+
+def _merge_section(
+    raw_section: dict[str, Any],
+    default_values: Mapping[str, Any],
+    section_name: str,
+) -> dict[str, Any]:
+    """
+    Merge a config section over its defaults, coercing only the values set in the YAML.
+
+    Parameters
+    ----------
+    raw_section: dict[str, Any]
+        The section as parsed from the YAML.
+    default_values: Mapping[str, Any]
+        The default values of the section, which already have the right types.
+    section_name: str
+        The name of the config section, used for error messages.
+
+    Returns
+    -------
+    : dict[str, Any]
+        The merged section values. Unknown keys are dropped.
+    """
+    section_values = dict(default_values)
+    coercers = _SCHEMA[section_name]
+    for key, value in raw_section.items():
+        coerce = coercers.get(key)
+        if coerce is not None:
+            section_values[key] = coerce(value, f"{section_name}.{key}")
+    return section_values
+
+def _read_config_document(config_file: Path) -> Any:
+    """
+    Parse a YAML config file, reusing the parsed document while the file is unchanged.
+
+    The parsed document is cached rather than the final `GeneratorConfig`, because the
+    default output paths are timestamped and must be rebuilt on every load. The returned
+    document is shared between calls and must not be mutated.
+
+    Parameters
+    ----------
+    config_file: Path
+        The absolute path to the YAML configuration file.
+
+    Returns
+    -------
+    : Any
+        The parsed YAML document.
+    """
+    stat = config_file.stat()
+    key = (str(config_file), stat.st_mtime_ns, stat.st_size)
+    if key in _config_cache:
+        _config_cache.move_to_end(key)
+        return _config_cache[key]
+
+    with config_file.open(encoding="utf-8") as file:
+        document = yaml.load(file, Loader=_SafeLoader)
+
+    _config_cache[key] = document
+    if len(_config_cache) > CONFIG_CACHE_SIZE:
+        _config_cache.popitem(last=False)
+    return document
+
 def load_config(config_path: Path | str) -> GeneratorConfig:
     """
     Load generator config from YAML with defaults, warnings, and validation.
@@ -330,72 +453,36 @@ def load_config(config_path: Path | str) -> GeneratorConfig:
     if not config_file.exists():
         raise FileNotFoundError(f"Configuration file not found: '{config_file}'.")
 
-    with config_file.open(encoding="utf-8") as file:
-        loaded_config = yaml.safe_load(file)
+    loaded_config = _read_config_document(config_file)
 
     raw_config = _normalise_mapping(loaded_config, "root")
-    defaults = _default_config_dict()
-    _warn_unknown_keys(raw_config, defaults)
+    _warn_unknown_keys(raw_config, _ALLOWED_ROOT)
 
-    merged_config: dict[str, dict[str, Any]] = {}
-    for section_name, default_values in defaults.items():
+    values: dict[str, dict[str, Any]] = {}
+    for section_name, default_values in _STATIC_DEFAULTS.items():
         raw_section = _normalise_mapping(raw_config.get(section_name, {}), section_name)
-        _warn_unknown_keys(raw_section, default_values, section_name=section_name)
-        merged_section = default_values.copy()
-        merged_section.update(raw_section)
-        merged_config[section_name] = merged_section
-
-    paths_section = merged_config["paths"]
-    runtime_section = merged_config["runtime"]
-    mesh_section = merged_config["mesh"]
-    scene_section = merged_config["scene"]
-    events_section = merged_config["events"]
-
-    runtime_num_scenes = _coerce_int(runtime_section["num_scenes"], "runtime.num_scenes")
-    if runtime_num_scenes <= 0:
+        _warn_unknown_keys(raw_section, _ALLOWED_SECTIONS[section_name], section_name=section_name)
+        values[section_name] = _merge_section(raw_section, default_values, section_name)
+
+    paths_values = values["paths"]
+    if _TIMESTAMPED_OUTPUT in (paths_values["audio_out"], paths_values["meta_out"]):
+        default_audio_out, default_meta_out = _build_default_output_paths()
+        if paths_values["audio_out"] is _TIMESTAMPED_OUTPUT:
+            paths_values["audio_out"] = default_audio_out
+        if paths_values["meta_out"] is _TIMESTAMPED_OUTPUT:
+            paths_values["meta_out"] = default_meta_out
+
+    if values["runtime"]["num_scenes"] <= 0:
         raise ValueError("Config key 'runtime.num_scenes' must be greater than 0.")
+    if values["runtime"]["num_workers"] < 0:
+        raise ValueError("Config key 'runtime.num_workers' must not be negative.")
 
     return GeneratorConfig(
-        paths=PathsConfig(
-            fg_dir=_coerce_path(paths_section["fg_dir"], "paths.fg_dir"),
-            audio_out=_coerce_path(paths_section["audio_out"], "paths.audio_out"),
-            meta_out=_coerce_path(paths_section["meta_out"], "paths.meta_out"),
-        ),
-        runtime=RuntimeConfig(
-            seed=_coerce_int(runtime_section["seed"], "runtime.seed"),
-            num_scenes=runtime_num_scenes,
-            num_mics_per_scene=_coerce_int(
-                runtime_section["num_mics_per_scene"], "runtime.num_mics_per_scene"
-            ),
-        ),
-        mesh=MeshConfig(
-            mesh_dir=_coerce_path(mesh_section["mesh_dir"], "mesh.mesh_dir"),
-            download_gibson_flag=_coerce_bool(
-                mesh_section["download_gibson_flag"], "mesh.download_gibson_flag"
-            ),
-        ),
-        scene=SceneConfig(
-            sample_rate=_coerce_int(scene_section["sample_rate"], "scene.sample_rate"),
-            scene_duration=_coerce_float(scene_section["scene_duration"], "scene.scene_duration"),
-            max_overlap=_coerce_int(scene_section["max_overlap"], "scene.max_overlap"),
-            mic_type=_coerce_str(scene_section["mic_type"], "scene.mic_type"),
-            bg_noise_floor_db=_coerce_float(
-                scene_section["bg_noise_floor_db"], "scene.bg_noise_floor_db"
-            ),
-        ),
-        events=EventsConfig(
-            events_per_scene=_coerce_int(
-                events_section["events_per_scene"], "events.events_per_scene"
-            ),
-            event_duration_min=_coerce_float(
-                events_section["event_duration_min"], "events.event_duration_min"
-            ),
-            event_duration_max=_coerce_float(
-                events_section["event_duration_max"], "events.event_duration_max"
-            ),
-            snr_min=_coerce_float(events_section["snr_min"], "events.snr_min"),
-            snr_max=_coerce_float(events_section["snr_max"], "events.snr_max"),
-        ),
+        paths=PathsConfig(**values["paths"]),
+        runtime=RuntimeConfig(**values["runtime"]),
+        mesh=MeshConfig(**values["mesh"]),
+        scene=SceneConfig(**values["scene"]),
+        events=EventsConfig(**values["events"]),
     )
 
 def list_audio_files(root_dir: Path) -> list[Path]:
@@ -414,9 +501,43 @@ def list_audio_files(root_dir: Path) -> list[Path]:
     """
     if not root_dir.is_dir() or not root_dir.exists():
         raise ValueError(f"The specified path '{root_dir}' is not a valid directory.")
-    audio_files = list(root_dir.glob("*.wav"))
+    with os.scandir(root_dir) as entries:
+        audio_files = [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(".wav") and entry.is_file()
+        ]
     return sorted(audio_files)
 
+def _iter_glb_files(root_dir: Path | str) -> Iterator[Path]:
+    """
+    Yield GLB files below a directory using an iterative `os.scandir` walk.
+
+    Directories that cannot be read are skipped, as with `Path.rglob`.
+
+    Parameters
+    ----------
+    root_dir: Path | str
+        The directory to search.
+
+    Returns
+    -------
+    : Iterator[Path]
+        An iterator over the GLB files found, in no particular order.
+    """
+    stack = [os.fspath(root_dir)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".glb") and entry.is_file():
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
 def list_mesh_files(mesh_dir: Path) -> list[Path]:
     """
     Recursively retrieve all GLB mesh files from a directory.
@@ -440,8 +561,7 @@ def list_mesh_files(mesh_dir: Path) -> list[Path]:
         print(f"The specified mesh directory '{mesh_dir}' is not valid. Download dataset...")
         # raise ValueError(f"The specified path '{mesh_dir}' is not a valid directory.")
         return []
-    mesh_files = [p for p in mesh_dir.rglob("*.glb") if p.is_file()]
-    return sorted(mesh_files)
+    return sorted(_iter_glb_files(mesh_dir))
 
 def ensure_meshes(mesh_dir: Path, download_gibson_flag: bool) -> list[Path]:
     """
@@ -482,6 +602,8 @@ def ensure_meshes(mesh_dir: Path, download_gibson_flag: bool) -> list[Path]:
 
     mesh_dir.mkdir(parents=True, exist_ok=True)
 
+    from audiblelight.download_data import download_gibson  # noqa: PLC0415
+
     download_gibson(path=str(mesh_dir), cleanup=False, remote=["habitat_1.5gb"])
 
     meshes = list_mesh_files(mesh_dir)
@@ -489,28 +611,128 @@ def ensure_meshes(mesh_dir: Path, download_gibson_flag: bool) -> list[Path]:
         raise RuntimeError(f"Downloaded Gibson but still found no .glb meshes under '{mesh_dir}'.")
     return meshes
 
-def build_backend_kwargs_rlr(mesh_path: Path) -> dict[str, object]:
+@functools.lru_cache(maxsize=16)
+def build_backend_kwargs_rlr(mesh_path: str) -> Mapping[str, object]:
     """
     Build backend keyword arguments for RLR (Ray-based Light Rendering) backend.
 
+    The result is cached per mesh path and returned as a read-only mapping, since the
+    same object is shared between all scenes using that mesh.
+
     Parameters
     ----------
-    mesh_path: Path
+    mesh_path: str
         Path to the mesh file to be used in RLR rendering.
 
     Returns
     -------
-    : dict[str, object]
-        A dictionary containing backend configuration with mesh path (as string)
+    : Mapping[str, object]
+        A read-only mapping containing backend configuration with mesh path
         and context addition flag set to False.
     """
-    return {
-        "mesh": str(mesh_path),
-        "add_to_context": False,
-    }
+    return MappingProxyType(
+        {
+            "mesh": mesh_path,
+            "add_to_context": False,
+        }
+    )
+
+# AudibleLight's own mesh loader, saved by `enable_mesh_cache` before it is replaced.
+_audiblelight_load_mesh: Callable[[str], Any]
+
+@functools.lru_cache(maxsize=MESH_CACHE_SIZE)
+def _load_mesh_cached(mesh_path: str) -> Any:
+    """
+    Load a mesh through AudibleLight, reusing the parsed mesh for repeated paths.
+
+    Parameters
+    ----------
+    mesh_path: str
+        Path to the mesh file, used as the cache key.
+
+    Returns
+    -------
+    : Any
+        The loaded trimesh object, shared between all scenes using the same mesh.
+    """
+    return _audiblelight_load_mesh(mesh_path)
+
+def _load_mesh(mesh_path: Path | str) -> Any:
+    """Drop-in replacement for `audiblelight.worldstate.load_mesh` backed by the mesh cache."""
+    return _load_mesh_cached(str(mesh_path))
+
+def enable_mesh_cache() -> None:
+    """
+    Route AudibleLight's mesh loading through a per-process LRU cache.
+
+    AudibleLight parses the mesh file every time a scene is created. Scenes drawing the
+    same mesh share the parsed mesh instead, which also keeps trimesh's cached bounds and
+    ray-tracing acceleration structures alive between scenes. The shared mesh is not
+    modified in place because mesh repair is disabled by default.
+
+    Returns
+    -------
+    : None
+    """
+    global _audiblelight_load_mesh  # noqa: PLW0603
+    from audiblelight import worldstate  # noqa: PLC0415
+
+    if worldstate.load_mesh is not _load_mesh:
+        _audiblelight_load_mesh = worldstate.load_mesh
+        worldstate.load_mesh = _load_mesh
+
+def move_file(src: Path | str, dst: Path | str) -> None:
+    """
+    Move a file, using a single rename when source and destination share a filesystem.
+
+    Parameters
+    ----------
+    src: Path | str
+        Path to the file to move.
+    dst: Path | str
+        Destination path of the file. An existing file is overwritten.
+
+    Returns
+    -------
+    : None
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+_prefetched_fg_files: set[Path] = set()
+
+def prefetch_audio_file(audio_file: Path) -> None:
+    """
+    Ask the OS to read an audio file into the page cache on its first use in this process.
+
+    AudibleLight only accepts file paths for events and decodes them itself, so clips cannot
+    be handed over as in-memory arrays. Prefetching instead starts the read asynchronously,
+    so the decode does not block on a cold filesystem cache.
+
+    Parameters
+    ----------
+    audio_file: Path
+        Path to the audio file to prefetch.
+
+    Returns
+    -------
+    : None
+    """
+    if audio_file in _prefetched_fg_files or not hasattr(os, "posix_fadvise"):
+        return
+    _prefetched_fg_files.add(audio_file)
+    fd = os.open(audio_file, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
 
 def add_random_microphone(  # type: ignore[no-any-unimported] # noqa: PLR0913
-    scene: audiblelight.Scene,
+    scene: "audiblelight.Scene",
     mic_type: str,
 ) -> bool:
     """
@@ -537,40 +759,75 @@ def add_random_microphone(  # type: ignore[no-any-unimported] # noqa: PLR0913
     except ValueError:
         return False
 
-def add_random_fg_event(  # type: ignore[no-any-unimported] # noqa: PLR0913
+def make_event_plan(
+    rng: np.random.Generator,
     fg_files: list[Path],
-    scene: audiblelight.Scene,
     scene_duration: float,
-    event_duration_min: float,
-    event_duration_max: float,
-    snr_min: float,
-    snr_max: float,
-    rng: np.random.Generator,
-) -> bool:
+    events: EventsConfig,
+) -> EventPlan:
     """
-    Attempt to add a foreground event at a random valid position in the scene.
+    Draw the foreground files, timing and level of all events of a scene in one batch.
 
     Parameters
     ----------
+    rng: np.random.Generator
+        A numpy random number generator instance.
     fg_files: list[Path]
         A list of Path objects pointing to available foreground audio files.
+    scene_duration: float
+        The total duration of the scene in seconds, bounding the event start times.
+    events: EventsConfig
+        The event configuration, giving the number of events and the sampling ranges.
+
+    Returns
+    -------
+    : EventPlan
+        The planned events of the scene, `events.events_per_scene` long.
+    """
+    n_events = events.events_per_scene
+    fg_idx = rng.integers(0, len(fg_files), size=n_events)
+    durations = rng.uniform(events.event_duration_min, events.event_duration_max, size=n_events)
+    starts = rng.uniform(0, scene_duration - durations)
+    snrs = rng.uniform(events.snr_min, events.snr_max, size=n_events)
+    return EventPlan(
+        wavs=[fg_files[i] for i in fg_idx.tolist()],
+        starts=starts,
+        durations=durations,
+        snrs=snrs,
+    )
+
+def add_random_fg_event(  # type: ignore[no-any-unimported]
+    scene: "audiblelight.Scene",
+    wav: Path,
+    event_start: float,
+    event_duration: float,
+    signal_to_noise_ratio: float,
+) -> bool:
+    """
+    Attempt to add a foreground event at a random valid position in the scene.
+
+    The event timing and level are drawn by the caller in one batch per scene; only the
+    position is left to the backend.
+
+    Parameters
+    ----------
     scene: audiblelight.Scene
         The scene to which the foreground event should be added.
-    scene_duration: float
-        The total duration of the scene in seconds, used to determine valid event start times.
-    event_duration_min: float
-        The minimum duration of the foreground event in seconds.
-    event_duration_max: float
-        The maximum duration of the foreground event in seconds.
-    snr_min: float
-        The minimum signal-to-noise ratio (SNR) for the foreground event in decibels.
-    snr_max: float
-        The maximum signal-to-noise ratio (SNR) for the foreground event in decibels.
+    wav: Path
+        Path to the foreground audio file to use for the event.
+    event_start: float
+        The start time of the foreground event within the scene in seconds.
+    event_duration: float
+        The duration of the foreground event in seconds.
+    signal_to_noise_ratio: float
+        The signal-to-noise ratio (SNR) for the foreground event in decibels.
+
+    Returns
+    -------
+    : bool
+        True if the foreground event was successfully added, False otherwise.
     """
-    wav = Path(fg_files[int(rng.integers(0, len(fg_files)))])
-    event_duration = float(rng.uniform(event_duration_min, event_duration_max))
-    event_start = float(rng.uniform(0, scene_duration - event_duration))
-    signal_to_noise_ratio = float(rng.uniform(snr_min, snr_max))
+    prefetch_audio_file(wav)
 
     try:
         scene.add_event_static(
@@ -585,20 +842,21 @@ def add_random_fg_event(  # type: ignore[no-any-unimported] # noqa: PLR0913
     except ValueError:
         return False
 
-def get_random_bg_noise(rng: np.random.Generator) -> str:
+def get_random_bg_noises(rng: np.random.Generator, n: int) -> list[str]:
     """
-    Select a random background noise type.
+    Select random background noise types for several scenes in one draw.
 
     Parameters
     ----------
     rng: np.random.Generator
         A numpy random number generator instance.
+    n: int
+        The number of background noise types to select.
 
     Returns
     -------
-    : str
-        A string representing a randomly selected background noise type.
+    : list[str]
+        A list of `n` randomly selected background noise types.
         Possible values are: "white", "pink", or "gaussian".
     """
-    bg_noises = ["white", "pink", "gaussian"]
-    return bg_noises[int(rng.integers(0, len(bg_noises)))]
+    return [_BG_NOISES[i] for i in rng.integers(0, len(_BG_NOISES), size=n)]